@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
+import platform
 import subprocess
 import sys
 from pathlib import Path
 from typing import Optional
 
 LOG_FILE: Optional[Path] = None
+REPO_ROOT = Path(__file__).resolve().parents[1]
+BACKEND_DIR = REPO_ROOT / "backend"
+HOST_SYSTEM = platform.system()
 INTERRUPTED_EXIT_CODE = 130
+HELP_ARGS = frozenset({"-h", "--help", "help"})
 
 
 def _append_log(line: str) -> None:
@@ -77,18 +82,15 @@ def run(cmd: list[str], cwd: Path) -> None:
 
 
 def is_raspberry_pi() -> bool:
-    import platform
-
-    if platform.system() != "Linux":
+    if HOST_SYSTEM != "Linux":
         return False
     for path in (
-            Path("/sys/firmware/devicetree/base/model"),
-            Path("/proc/device-tree/model"),
+            "/sys/firmware/devicetree/base/model",
+            "/proc/device-tree/model",
     ):
         try:
-            txt = path.read_text(errors="ignore").lower()
-            if "raspberry pi" in txt:
-                return True
+            with open(path, "rb") as f:
+                return b"raspberry pi" in f.read(256).lower()
         except FileNotFoundError:
             continue
     return False
@@ -189,7 +191,7 @@ def print_usage(exit_code: int = 1) -> None:
 
 def main() -> None:
     raw_args = [a.strip() for a in sys.argv[1:]]
-    if any(a in {"-h", "--help", "help"} for a in raw_args):
+    if any(a in HELP_ARGS for a in raw_args):
         print_usage(0)
 
     force_pi = False
@@ -232,11 +234,9 @@ def main() -> None:
         print("Error: testing, hitl-mode, and test-fire-mode are mutually exclusive.", file=sys.stderr)
         sys.exit(1)
 
-    repo_root = Path(__file__).resolve().parents[1]
-    backend_dir = repo_root / "backend"
-    _configure_log_file(repo_root, log_file_arg)
+    _configure_log_file(REPO_ROOT, log_file_arg)
     build_backend(
-        backend_dir,
+        BACKEND_DIR,
         force_pi,
         force_no_pi,
         testing_mode,
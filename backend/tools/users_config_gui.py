@@ -17,6 +17,11 @@ DEFAULT_ITERATIONS = 120_000
 DEFAULT_SESSION_TTL_SECONDS = 14 * 24 * 60 * 60
 DEFAULT_USERS_PATH = Path(__file__).resolve().parents[1] / "users" / "users.json"
 DEFAULT_COMMANDS_SOURCE = Path(__file__).resolve().parents[1] / "src" / "sequences.rs"
+COMMAND_NAMES_BLOCK_RE = re.compile(
+    r"pub fn all_command_names\(\) -> Vec<&'static str>\s*\{\s*vec!\[(?P<body>.*?)\]\s*\}",
+    re.DOTALL,
+)
+QUOTED_STRING_RE = re.compile(r'"([^"]+)"')
 
 
 def normalize_permissions(value: dict[str, Any] | None) -> dict[str, bool]:
@@ -76,13 +81,8 @@ def available_commands(source_path: Path = DEFAULT_COMMANDS_SOURCE) -> list[str]
         return []
 
     commands: list[str] = []
-    for match in re.finditer(
-            r"pub fn all_command_names\(\) -> Vec<&'static str>\s*\{\s*vec!\[(?P<body>.*?)\]\s*\}",
-            raw,
-            re.DOTALL,
-    ):
-        body = match.group("body")
-        commands.extend(re.findall(r'"([^"]+)"', body))
+    for match in COMMAND_NAMES_BLOCK_RE.finditer(raw):
+        commands.extend(QUOTED_STRING_RE.findall(match.group("body")))
     return sorted(set(commands))
 
 
@@ -1,18 +1,35 @@
 #!/usr/bin/env python3
-import multiprocessing as mp
+import atexit
+import functools
+import hashlib
+import json
 import os
 import platform
+import shlex
 import shutil
+import signal
+import stat
 import subprocess
 import sys
+import tempfile
+import threading
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from subprocess import DEVNULL
+from types import SimpleNamespace
 from typing import Optional
 
 LOG_FILE: Optional[Path] = None
+REPO_ROOT = Path(__file__).resolve().parent
+HOST_SYSTEM = platform.system()
 INTERRUPTED_EXIT_CODE = 130
+CANCEL_GRACE_SECONDS = 10
 FRONTEND_REPO_URL = "https://github.com/Rylan-Meilutis/Seds-Ground-Station-Frontend"
 FRONTEND_CHECKOUT_ENV = "GS26_FRONTEND_CHECKOUT_DIR"
+COMPOSE_CMD_ENV = "GROUNDSTATION_COMPOSE_CMD"
+CACHE_IMAGE_ENV = "GROUNDSTATION_CACHE_IMAGE"
+CI_ENV = "GROUNDSTATION_CI"
+COMPOSE_BUILD_SERVICE = "web"
 WASM_OPT_FAILURE_HINTS = (
     "wasm-opt failed",
     "error parsing wasm",
@@ -20,6 +37,27 @@ WASM_OPT_FAILURE_HINTS = (
     "compile unit size was incorrect",
     "invalid code after misc prefix",
 )
+TRUTHY_VALUES = frozenset({"1", "true", "yes", "on"})
+HELP_ARGS = frozenset({"-h", "--help", "help"})
+FRONTEND_WEB_ARGS = frozenset({"web", "frontend_web"})
+FLAG_ARGS = {
+    "pi_build": "force_pi",
+    "no_pi": "force_no_pi",
+    "docker": "docker_mode",
+    "plain": "plain_mode",
+    "testing": "testing_mode",
+    "hitl-mode": "hitl_mode",
+    "test-fire-mode": "test_fire_mode",
+    "debug": "debug_mode",
+    "max_size": "max_size_mode",
+    "backend_only": "backend_only",
+    "backend": "backend_only",
+    "existing": "use_existing",
+}
+
+_ACTIVE_PROCS: set[subprocess.Popen] = set()
+_ACTIVE_PROCS_LOCK = threading.RLock()
+_BUILD_CANCELLED = threading.Event()
 
 
 def _append_log(line: str) -> None:
@@ -29,39 +67,107 @@ def _append_log(line: str) -> None:
         f.write(line)
 
 
-def run(cmd: list[str], cwd: Path) -> None:
-    cmd = [str(part) for part in cmd]
-    cmd_line = f"Running: {' '.join(cmd)} (cwd={cwd})"
-    print(cmd_line)
-    _append_log(cmd_line + "\n")
-    if LOG_FILE is None:
-        try:
-            subprocess.run(cmd, cwd=cwd, check=True)
-        except KeyboardInterrupt:
-            raise
+def _start_process(cmd: list[str], cwd: Path, env: Optional[dict[str, str]], capture: bool) -> subprocess.Popen:
+    output = {"stdout": subprocess.PIPE, "stderr": subprocess.STDOUT, "text": True, "bufsize": 1} if capture else {}
+    with _ACTIVE_PROCS_LOCK:
+        if _BUILD_CANCELLED.is_set():
+            raise subprocess.CalledProcessError(INTERRUPTED_EXIT_CODE, cmd)
+        proc = subprocess.Popen(cmd, cwd=cwd, env=env, start_new_session=HOST_SYSTEM != "Windows", **output)
+        _ACTIVE_PROCS.add(proc)
+    return proc
+
+
+def _killpg(proc: subprocess.Popen, sig: int) -> None:
+    # Only signal groups whose leader has not been reaped; an empty group's id can be reused.
+    if proc.poll() is not None:
         return
-    proc = subprocess.Popen(
-        cmd,
-        cwd=cwd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
-    )
-    assert proc.stdout is not None
     try:
-        for line in proc.stdout:
-            print(line, end="")
-            _append_log(line)
-        rc = proc.wait()
+        os.killpg(proc.pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+def _signal_process_group(proc: subprocess.Popen, force: bool) -> None:
+    if HOST_SYSTEM == "Windows":
+        if proc.poll() is None:
+            proc.terminate()
+        return
+    _killpg(proc, signal.SIGKILL if force else signal.SIGINT)
+
+
+def _signal_active_groups(sig: int) -> None:
+    with _ACTIVE_PROCS_LOCK:
+        procs = list(_ACTIVE_PROCS)
+    for proc in procs:
+        _killpg(proc, sig)
+
+
+def _wait_process(proc: subprocess.Popen, lines: Optional[list[str]] = None) -> int:
+    try:
+        if proc.stdout is not None:
+            for line in proc.stdout:
+                print(line, end="")
+                _append_log(line)
+                if lines is not None:
+                    lines.append(line)
+        return proc.wait()
     except KeyboardInterrupt:
-        proc.terminate()
+        _signal_process_group(proc, force=False)
         try:
-            proc.wait(timeout=5)
+            proc.wait(timeout=CANCEL_GRACE_SECONDS)
         except subprocess.TimeoutExpired:
-            proc.kill()
+            _signal_process_group(proc, force=True)
             proc.wait()
         raise
+    finally:
+        with _ACTIVE_PROCS_LOCK:
+            _ACTIVE_PROCS.discard(proc)
+
+
+def _cancel_active_processes(force: bool = False) -> None:
+    with _ACTIVE_PROCS_LOCK:
+        _BUILD_CANCELLED.set()
+        procs = list(_ACTIVE_PROCS)
+    for proc in procs:
+        _signal_process_group(proc, force)
+
+
+def _stop_parallel_builds(futures: list[Future]) -> None:
+    _cancel_active_processes()
+    try:
+        wait(futures, timeout=CANCEL_GRACE_SECONDS)
+    finally:
+        _cancel_active_processes(force=True)
+
+
+def _interrupt_on_signal(signum: int, frame: object) -> None:
+    raise KeyboardInterrupt
+
+
+def _suspend_with_children(signum: int, frame: object) -> None:
+    _signal_active_groups(signal.SIGSTOP)
+    signal.signal(signal.SIGTSTP, signal.SIG_DFL)
+    os.kill(os.getpid(), signal.SIGTSTP)
+    signal.signal(signal.SIGTSTP, _suspend_with_children)
+    _signal_active_groups(signal.SIGCONT)
+
+
+def _install_child_signal_forwarding() -> None:
+    # Build children run in their own sessions, so terminal and group signals no longer reach them directly.
+    atexit.register(_cancel_active_processes, True)
+    if HOST_SYSTEM == "Windows":
+        return
+    signal.signal(signal.SIGTERM, _interrupt_on_signal)
+    signal.signal(signal.SIGHUP, _interrupt_on_signal)
+    signal.signal(signal.SIGTSTP, _suspend_with_children)
+
+
+def run(cmd: list[str], cwd: Path, env: Optional[dict[str, str]] = None) -> None:
+    cmd = [str(part) for part in cmd]
+    cmd_line = f"Running: {' '.join(cmd)} (cwd={cwd})"
+    print(cmd_line)
+    _append_log(cmd_line + "\n")
+    rc = _wait_process(_start_process(cmd, cwd, env, capture=LOG_FILE is not None))
     if rc != 0:
         raise subprocess.CalledProcessError(rc, cmd)
 
@@ -73,6 +179,13 @@ def run_capture(cmd: list[str], cwd: Path) -> str:
     return out.strip()
 
 
+def _require_tools(*tools: str) -> None:
+    missing = [tool for tool in tools if shutil.which(tool) is None]
+    if missing:
+        print(f"Error: required tool(s) not found on PATH: {', '.join(missing)}", file=sys.stderr)
+        sys.exit(127)
+
+
 def _configure_log_file(repo_root: Path, log_file_arg: Optional[str]) -> None:
     global LOG_FILE
     if not log_file_arg:
@@ -86,68 +199,115 @@ def _configure_log_file(repo_root: Path, log_file_arg: Optional[str]) -> None:
     print(f"Logging command output to: {LOG_FILE}")
 
 
+@functools.lru_cache(maxsize=1)
 def is_raspberry_pi() -> bool:
-    if platform.system() != "Linux":
+    if HOST_SYSTEM != "Linux":
         return False
     for path in (
-            Path("/sys/firmware/devicetree/base/model"),
-            Path("/proc/device-tree/model"),
+            "/sys/firmware/devicetree/base/model",
+            "/proc/device-tree/model",
     ):
         try:
-            txt = path.read_text(errors="ignore").lower()
-            if "raspberry pi" in txt:
-                return True
+            with open(path, "rb") as f:
+                return b"raspberry pi" in f.read(256).lower()
         except FileNotFoundError:
             continue
     return False
 
 
+@functools.lru_cache(maxsize=1)
 def no_parallel_requested() -> bool:
-    return os.environ.get("GROUNDSTATION_NO_PARALLEL", "").strip().lower() in {"1", "true", "yes", "on"}
+    return os.environ.get("GROUNDSTATION_NO_PARALLEL", "").strip().lower() in TRUTHY_VALUES
+
+
+@functools.lru_cache(maxsize=1)
+def ci_requested() -> bool:
+    return os.environ.get(CI_ENV, "").strip().lower() in TRUTHY_VALUES
 
 
+@functools.lru_cache(maxsize=1)
 def is_container() -> bool:
-    if Path("/.dockerenv").exists():
+    if os.path.exists("/.dockerenv"):
         return True
     try:
-        cgroup = Path("/proc/1/cgroup")
-        if cgroup.exists():
-            txt = cgroup.read_text(errors="ignore").lower()
-            if "docker" in txt or "containerd" in txt or "kubepods" in txt:
-                return True
-    except Exception:
-        pass
-    return False
+        with open("/proc/1/cgroup", "rb") as f:
+            data = f.read(4096).lower()
+    except OSError:
+        return False
+    return b"docker" in data or b"containerd" in data or b"kubepods" in data
 
 
+@functools.lru_cache(maxsize=1)
 def in_docker_build() -> bool:
     if no_parallel_requested():
         return True
     return is_container()
 
 
-def get_compose_base_cmd() -> list[str]:
-    try:
-        subprocess.run(["docker", "compose", "version"], stdout=DEVNULL, stderr=DEVNULL, check=True)
-        return ["docker", "compose"]
-    except (FileNotFoundError, subprocess.CalledProcessError):
-        pass
-    try:
-        subprocess.run(["docker-compose", "version"], stdout=DEVNULL, stderr=DEVNULL, check=True)
-        return ["docker-compose"]
-    except (FileNotFoundError, subprocess.CalledProcessError):
-        print(
-            "Error: Neither 'docker compose' nor 'docker-compose' is available.\nPlease install Docker and Docker "
-            "Compose.",
-            file=sys.stderr,
+@functools.lru_cache(maxsize=1)
+def get_compose_base_cmd() -> tuple[str, ...]:
+    override = os.environ.get(COMPOSE_CMD_ENV, "").strip()
+    if override:
+        if HOST_SYSTEM == "Windows":
+            # Non-POSIX splitting keeps backslashes but also leaves the quotes on quoted paths.
+            return tuple(part.strip('"') for part in shlex.split(override, posix=False))
+        return tuple(shlex.split(override))
+    docker = shutil.which("docker")
+    if docker is not None:
+        try:
+            subprocess.run([docker, "compose", "version"], stdout=DEVNULL, stderr=DEVNULL, check=True,
+                           close_fds=HOST_SYSTEM == "Windows")
+            return ("docker", "compose")
+        except (FileNotFoundError, subprocess.CalledProcessError):
+            pass
+    if shutil.which("docker-compose") is not None:
+        return ("docker-compose",)
+    print(
+        "Error: Neither 'docker compose' nor 'docker-compose' is available.\nPlease install Docker and Docker "
+        "Compose.",
+        file=sys.stderr,
+    )
+    sys.exit(1)
+
+
+def _write_registry_cache_override(cache_ref: str) -> Path:
+    with tempfile.NamedTemporaryFile(
+            "w", suffix=".yml", prefix="gs26-compose-cache-", delete=False, encoding="utf-8"
+    ) as f:
+        f.write(
+            "services:\n"
+            f"  {COMPOSE_BUILD_SERVICE}:\n"
+            "    build:\n"
+            "      cache_from:\n"
+            f"        - {json.dumps(f'type=registry,ref={cache_ref}')}\n"
+            "      cache_to:\n"
+            f"        - {json.dumps(f'type=registry,ref={cache_ref},mode=max')}\n"
         )
-        sys.exit(1)
+        return Path(f.name)
 
 
 def build_docker(repo_root: Path, pi_build: bool, testing: bool, plain_progress: bool) -> None:
-    compose_cmd = get_compose_base_cmd()
+    compose_cmd = list(get_compose_base_cmd())
+    legacy_compose = compose_cmd[:1] == ["docker-compose"]
+    parallel_services = not no_parallel_requested()
+    env = os.environ.copy()
+    env.setdefault("DOCKER_BUILDKIT", "1")
+    env.setdefault("COMPOSE_DOCKER_CLI_BUILD", "1")
+    if not parallel_services:
+        env.setdefault("COMPOSE_PARALLEL_LIMIT", "1")
+    override_file: Optional[Path] = None
+    cache_image = os.environ.get(CACHE_IMAGE_ENV, "").strip()
+    if cache_image:
+        if legacy_compose:
+            print(f"Error: {CACHE_IMAGE_ENV} needs the docker compose v2 plugin (build.cache_to).", file=sys.stderr)
+            sys.exit(1)
+        print(f"Docker build cache → importing and exporting all {COMPOSE_BUILD_SERVICE} stages via {cache_image}")
+        override_file = _write_registry_cache_override(cache_image)
+        compose_cmd.extend(["-f", str(repo_root / "docker-compose.yml"), "-f", str(override_file)])
     cmd: list[str] = [*compose_cmd, "build"]
-    if plain_progress and compose_cmd == ["docker", "compose"]:
+    if parallel_services and legacy_compose:
+        cmd.append("--parallel")
+    if plain_progress and compose_cmd[:2] == ["docker", "compose"]:
         cmd.extend(["--progress", "plain"])
     if pi_build:
         print("Pi build (docker) → passing --build-arg PI_BUILD=TRUE")
@@ -155,47 +315,41 @@ def build_docker(repo_root: Path, pi_build: bool, testing: bool, plain_progress:
     if testing:
         print("Testing mode (docker) → passing --build-arg TESTING=TRUE")
         cmd.extend(["--build-arg", "TESTING=TRUE"])
-    run(cmd, cwd=repo_root)
+    try:
+        run(cmd, cwd=repo_root, env=env)
+    finally:
+        if override_file is not None:
+            override_file.unlink(missing_ok=True)
+
 
+def _run_script(repo_root: Path, script: Path, args: list[str], env: Optional[dict[str, str]] = None) -> None:
+    run([sys.executable, str(script), *args], cwd=repo_root, env=env)
 
-def _run_script(repo_root: Path, script: Path, args: list[str]) -> None:
-    run([sys.executable, str(script), *args], cwd=repo_root)
 
+def _parallel_build_env() -> dict[str, str]:
+    env = os.environ.copy()
+    env.setdefault("CARGO_BUILD_JOBS", str(max(1, (os.cpu_count() or 4) // 2)))
+    if shutil.which("sccache") is not None:
+        env.setdefault("RUSTC_WRAPPER", "sccache")
+    return env
 
-def _run_frontend_script_with_wasm_opt_fallback(script: Path, checkout_dir: Path, args: list[str]) -> None:
+
+def _run_frontend_script_with_wasm_opt_fallback(
+        script: Path,
+        checkout_dir: Path,
+        args: list[str],
+        env: Optional[dict[str, str]] = None,
+) -> bool:
     cmd = [sys.executable, str(script), *args]
     cmd_line = f"Running: {' '.join(str(part) for part in cmd)} (cwd={checkout_dir})"
     print(cmd_line)
     _append_log(cmd_line + "\n")
 
-    proc = subprocess.Popen(
-        [str(part) for part in cmd],
-        cwd=checkout_dir,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
-    )
-    assert proc.stdout is not None
-
     lines: list[str] = []
-    try:
-        for line in proc.stdout:
-            print(line, end="")
-            _append_log(line)
-            lines.append(line)
-        rc = proc.wait()
-    except KeyboardInterrupt:
-        proc.terminate()
-        try:
-            proc.wait(timeout=5)
-        except subprocess.TimeoutExpired:
-            proc.kill()
-            proc.wait()
-        raise
+    rc = _wait_process(_start_process([str(part) for part in cmd], checkout_dir, env, capture=True), lines)
 
     if rc == 0:
-        return
+        return True
 
     combined_output = "".join(lines).lower()
     public_dir = _resolve_external_public_dir(checkout_dir)
@@ -206,7 +360,7 @@ def _run_frontend_script_with_wasm_opt_fallback(script: Path, checkout_dir: Path
         )
         print(warning)
         _append_log(warning + "\n")
-        return
+        return False
 
     raise subprocess.CalledProcessError(rc, [str(part) for part in cmd])
 
@@ -223,15 +377,16 @@ def _default_frontend_checkout_dir() -> Path:
     if override:
         path = Path(override).expanduser()
         return path if path.is_absolute() else Path.cwd() / path
-    if platform.system() == "Darwin":
+    if HOST_SYSTEM == "Darwin":
         return Path.home() / "Library" / "Caches" / "GroundStation26" / "frontend-source"
-    if platform.system() == "Windows":
+    if HOST_SYSTEM == "Windows":
         local_app_data = os.environ.get("LOCALAPPDATA", "").strip()
         if local_app_data:
             return Path(local_app_data) / "GroundStation26" / "frontend-source"
     return Path.home() / ".cache" / "groundstation26" / "frontend-source"
 
 
+@functools.lru_cache(maxsize=1)
 def _frontend_checkout_dir() -> Path:
     return _default_frontend_checkout_dir()
 
@@ -244,6 +399,28 @@ def _frontend_sync_public_dir(repo_root: Path) -> Path:
     return _frontend_sync_dir(repo_root) / "dist" / "public"
 
 
+def _frontend_build_stamp(repo_root: Path) -> Path:
+    return _frontend_sync_dir(repo_root) / "dist" / ".build-fingerprint"
+
+
+def _frontend_lockfile_digest(checkout_dir: Path) -> str:
+    for candidate in (checkout_dir / "Cargo.lock", checkout_dir / "frontend" / "Cargo.lock"):
+        try:
+            return "lock:" + hashlib.sha256(candidate.read_bytes()).hexdigest()[:16]
+        except FileNotFoundError:
+            continue
+    return "lock:none"
+
+
+def _frontend_build_fingerprint(checkout_dir: Path, args: list[str]) -> str:
+    head = run_capture(["git", "-C", str(checkout_dir), "rev-parse", "HEAD"], cwd=checkout_dir)
+    try:
+        toolchain = run_capture(["rustc", "-V"], cwd=checkout_dir)
+    except (OSError, subprocess.CalledProcessError):
+        toolchain = "rustc unknown"
+    return " | ".join([head, toolchain, _frontend_lockfile_digest(checkout_dir), " ".join(args)])
+
+
 def _resolve_external_frontend_script(checkout_dir: Path) -> Path:
     candidates = [
         checkout_dir / "build.py",
@@ -297,12 +474,14 @@ def _resolve_external_favicon(checkout_dir: Path) -> Optional[Path]:
 
 
 def _ensure_frontend_checkout(checkout_dir: Path) -> None:
-    if not checkout_dir.exists():
+    try:
+        checkout_mode = checkout_dir.stat().st_mode
+    except FileNotFoundError:
         checkout_dir.parent.mkdir(parents=True, exist_ok=True)
         run(["git", "clone", "--depth", "1", FRONTEND_REPO_URL, str(checkout_dir)], cwd=checkout_dir.parent)
         return
 
-    if not checkout_dir.is_dir():
+    if not stat.S_ISDIR(checkout_mode):
         raise RuntimeError(f"Frontend checkout path exists but is not a directory: {checkout_dir}")
 
     inside_work_tree = run_capture(
@@ -333,33 +512,59 @@ def _ensure_frontend_checkout(checkout_dir: Path) -> None:
     run(["git", "-C", str(checkout_dir), "pull", "--ff-only"], cwd=checkout_dir)
 
 
+def _remove_tree_in_background(path: Path) -> None:
+    threading.Thread(target=shutil.rmtree, args=(path,), kwargs={"ignore_errors": True}).start()
+
+
+def _copy_tree(src: Path, dst: Path) -> None:
+    if HOST_SYSTEM == "Darwin":
+        try:
+            subprocess.run(["/bin/cp", "-cRLp", f"{src}/", str(dst)], stderr=DEVNULL, check=True)
+            return
+        except (FileNotFoundError, subprocess.CalledProcessError):
+            shutil.rmtree(dst, ignore_errors=True)
+    shutil.copytree(src, dst)
+
+
 def _sync_frontend_public_assets(repo_root: Path, checkout_dir: Path) -> None:
     src_public_dir = _resolve_external_public_dir(checkout_dir)
     dst_public_dir = _frontend_sync_public_dir(repo_root)
     dst_public_dir.parent.mkdir(parents=True, exist_ok=True)
-    if dst_public_dir.exists():
-        shutil.rmtree(dst_public_dir)
+    staging_dir = dst_public_dir.with_name(f".{dst_public_dir.name}.new-{os.urandom(4).hex()}")
     print(f"Syncing frontend web assets: {src_public_dir} -> {dst_public_dir}")
-    shutil.copytree(src_public_dir, dst_public_dir)
-    favicon = _resolve_external_favicon(checkout_dir)
-    if favicon is not None:
-        dst_favicon = dst_public_dir / favicon.name
-        if favicon.resolve() != dst_favicon.resolve():
-            print(f"Syncing frontend favicon: {favicon} -> {dst_favicon}")
-            shutil.copy2(favicon, dst_favicon)
+    try:
+        _copy_tree(src_public_dir, staging_dir)
+        favicon = _resolve_external_favicon(checkout_dir)
+        if favicon is not None:
+            dst_favicon = staging_dir / favicon.name
+            if favicon.resolve() != dst_favicon.resolve():
+                print(f"Syncing frontend favicon: {favicon} -> {dst_public_dir / favicon.name}")
+                shutil.copy2(favicon, dst_favicon)
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
 
+    # Two renames, not one atomic swap: public/ is briefly absent between them.
+    previous_dir: Optional[Path] = dst_public_dir.with_name(f".{dst_public_dir.name}.old-{os.urandom(4).hex()}")
+    try:
+        os.replace(dst_public_dir, previous_dir)
+    except FileNotFoundError:
+        previous_dir = None
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+    try:
+        os.replace(staging_dir, dst_public_dir)
+    except BaseException:
+        if previous_dir is not None:
+            os.replace(previous_dir, dst_public_dir)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+    if previous_dir is not None:
+        _remove_tree_in_background(previous_dir)
 
-def _run_frontend_build(
-        repo_root: Path,
-        debug_mode: bool,
-        max_size_mode: bool,
-        use_existing: bool,
-        log_file_arg: Optional[str],
-) -> None:
-    checkout_dir = _frontend_checkout_dir()
-    _ensure_frontend_checkout(checkout_dir)
 
-    script = _resolve_external_frontend_script(checkout_dir)
+def _frontend_build_args(debug_mode: bool, max_size_mode: bool, use_existing: bool) -> list[str]:
     args = ["frontend_web"]
     if debug_mode:
         args.append("debug")
@@ -367,14 +572,47 @@ def _run_frontend_build(
         args.append("max_size")
     if use_existing:
         args.append("existing")
+    return args
+
+
+def _pending_frontend_build(repo_root: Path, args: list[str]) -> Optional[str]:
+    checkout_dir = _frontend_checkout_dir()
+    _ensure_frontend_checkout(checkout_dir)
+
+    stamp = _frontend_build_stamp(repo_root)
+    fingerprint = _frontend_build_fingerprint(checkout_dir, args)
+    try:
+        previous = stamp.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        previous = ""
+    if previous == fingerprint and _frontend_sync_public_dir(repo_root).is_dir():
+        print(f"Frontend checkout unchanged since last build ({fingerprint}) → reusing synced web assets.")
+        return None
+    stamp.unlink(missing_ok=True)
+    return fingerprint
+
+
+def _run_frontend_build(
+        repo_root: Path,
+        args: list[str],
+        fingerprint: str,
+        log_file_arg: Optional[str],
+        env: Optional[dict[str, str]] = None,
+) -> None:
+    checkout_dir = _frontend_checkout_dir()
+    script = _resolve_external_frontend_script(checkout_dir)
     if log_file_arg:
         log_path = Path(log_file_arg)
         if not log_path.is_absolute():
             log_path = repo_root / log_path
-        args.append(f"log={log_path}")
+        args = [*args, f"log={log_path}"]
 
-    _run_frontend_script_with_wasm_opt_fallback(script, checkout_dir, args)
+    clean_build = _run_frontend_script_with_wasm_opt_fallback(script, checkout_dir, args, env)
+    if _BUILD_CANCELLED.is_set():
+        return
     _sync_frontend_public_assets(repo_root, checkout_dir)
+    if clean_build:
+        _frontend_build_stamp(repo_root).write_text(fingerprint + "\n", encoding="utf-8")
 
 
 def _backend_script(repo_root: Path) -> Path:
@@ -420,8 +658,13 @@ def print_usage(exit_code: int = 1) -> None:
     print("  ./build.py debug                   # local: build frontend+backend in debug mode")
     print("  ./build.py max_size                # web wasm: add wasm-opt --converge (slower, smaller)")
     print("  ./build.py plain                   # docker only: pass --progress plain")
+    print(f"                                     # (also implied by log= or {CI_ENV}=1)")
     print("  ./build.py log=build.log           # tee command output into a log file")
     print("  ./build.py docker [pi_build|no_pi] [testing]")
+    print(f"                                     # set {COMPOSE_CMD_ENV} to skip compose detection")
+    print(f"                                     # set {CACHE_IMAGE_ENV}=<registry ref> to share a mode=max")
+    print("                                     # build cache (needs push access and a buildx builder")
+    print("                                     # that can export registry caches)")
     print("  ./build.py backend_only            # local: build backend only")
     print("  ./build.py frontend_web            # local: build frontend web only")
     print("  ./build.py web                     # alias for frontend_web")
@@ -431,179 +674,151 @@ def print_usage(exit_code: int = 1) -> None:
     print(f"  default checkout path is {FRONTEND_CHECKOUT_ENV} or {_frontend_checkout_dir()}")
     print("  the checkout is cloned only when absent and otherwise updated with `git pull --ff-only`")
     print("  local changes in the external checkout abort the update instead of being modified")
+    print("  the frontend build is skipped when the checkout HEAD, rustc version, Cargo.lock and build flags")
+    print("  match the last synced build; delete frontend/dist/.build-fingerprint to force a rebuild")
     sys.exit(exit_code)
 
 
 def main() -> None:
-    force_pi = False
-    force_no_pi = False
-    docker_mode = False
-    testing_mode = False
-    hitl_mode = False
-    test_fire_mode = False
-    debug_mode = False
-    max_size_mode = False
-    plain_mode = False
-    use_existing = False
-    backend_only = False
+    _install_child_signal_forwarding()
+    flags = SimpleNamespace(**dict.fromkeys(FLAG_ARGS.values(), False))
     log_file_arg: Optional[str] = None
     frontend_only_platform: Optional[str] = None
 
     raw_args = [a.strip() for a in sys.argv[1:]]
-    if any(a in {"-h", "--help", "help"} for a in raw_args):
+    if any(a in HELP_ARGS for a in raw_args):
         print_usage(0)
 
-    frontend_platforms = {"web", "frontend_web"}
-
     for raw_arg in raw_args:
         arg = raw_arg.lower()
-        if arg == "pi_build":
-            force_pi = True
-        elif arg == "no_pi":
-            force_no_pi = True
-        elif arg == "docker":
-            docker_mode = True
-        elif arg == "plain":
-            plain_mode = True
-        elif arg == "testing":
-            testing_mode = True
-        elif arg == "hitl-mode":
-            hitl_mode = True
-        elif arg == "test-fire-mode":
-            test_fire_mode = True
-        elif arg == "debug":
-            debug_mode = True
-        elif arg == "max_size":
-            max_size_mode = True
-        elif arg in {"backend_only", "backend"}:
-            backend_only = True
-        elif arg == "existing":
-            use_existing = True
+        flag = FLAG_ARGS.get(arg)
+        if flag is not None:
+            setattr(flags, flag, True)
         elif arg.startswith("log="):
             value = raw_arg.split("=", 1)[1].strip()
             if not value:
                 print("Error: log= requires a filepath.", file=sys.stderr)
                 print_usage()
             log_file_arg = value
-        elif arg in frontend_platforms:
-            if frontend_only_platform or backend_only:
+        elif arg in FRONTEND_WEB_ARGS:
+            if frontend_only_platform or flags.backend_only:
                 print("Error: Only one frontend action/build may be specified.", file=sys.stderr)
                 print_usage()
-            frontend_only_platform = "web" if arg in {"web", "frontend_web"} else arg
+            frontend_only_platform = "web"
         else:
             print(f"Error: Invalid argument '{arg}'.", file=sys.stderr)
             print_usage()
 
-    if force_pi and force_no_pi:
+    if flags.force_pi and flags.force_no_pi:
         print("Error: Cannot specify both 'pi_build' and 'no_pi'.", file=sys.stderr)
         sys.exit(1)
-    selected_modes = sum([testing_mode, hitl_mode, test_fire_mode])
+    selected_modes = sum([flags.testing_mode, flags.hitl_mode, flags.test_fire_mode])
     if selected_modes > 1:
         print("Error: Cannot specify more than one of 'testing', 'hitl-mode', and 'test-fire-mode'.", file=sys.stderr)
         sys.exit(1)
 
-    repo_root = Path(__file__).resolve().parent
+    repo_root = REPO_ROOT
     _configure_log_file(repo_root, log_file_arg)
 
     if frontend_only_platform is not None:
-        if docker_mode or force_pi or force_no_pi or testing_mode or hitl_mode or test_fire_mode:
+        if (flags.docker_mode or flags.force_pi or flags.force_no_pi or flags.testing_mode or flags.hitl_mode
+                or flags.test_fire_mode):
             print("Error: Frontend-only builds cannot be combined with docker/pi_build/no_pi/testing/hitl-mode/test-fire-mode.",
                   file=sys.stderr)
             print_usage()
-        _run_frontend_build(
-            repo_root=repo_root,
-            debug_mode=debug_mode,
-            max_size_mode=max_size_mode,
-            use_existing=use_existing,
-            log_file_arg=log_file_arg,
-        )
+        _require_tools("git")
+        frontend_args = _frontend_build_args(flags.debug_mode, flags.max_size_mode, flags.use_existing)
+        fingerprint = _pending_frontend_build(repo_root, frontend_args)
+        if fingerprint is not None:
+            _run_frontend_build(repo_root, frontend_args, fingerprint, log_file_arg)
         return
 
-    if backend_only:
-        if docker_mode:
+    if flags.backend_only:
+        if flags.docker_mode:
             print("Error: backend_only cannot be combined with docker mode.", file=sys.stderr)
             print_usage()
+        _require_tools("cargo")
         _run_script(
             repo_root,
             _backend_script(repo_root),
             _backend_args(
-                force_pi=force_pi,
-                force_no_pi=force_no_pi,
-                testing_mode=testing_mode,
-                hitl_mode=hitl_mode,
-                test_fire_mode=test_fire_mode,
-                debug_mode=debug_mode,
+                force_pi=flags.force_pi,
+                force_no_pi=flags.force_no_pi,
+                testing_mode=flags.testing_mode,
+                hitl_mode=flags.hitl_mode,
+                test_fire_mode=flags.test_fire_mode,
+                debug_mode=flags.debug_mode,
                 log_file_arg=log_file_arg,
             ),
         )
         return
 
-    if docker_mode:
-        if hitl_mode or test_fire_mode:
+    if flags.docker_mode:
+        if flags.hitl_mode or flags.test_fire_mode:
             print("Error: docker mode currently does not support 'hitl-mode' or 'test-fire-mode'.", file=sys.stderr)
             sys.exit(1)
-        pi_build_flag = False if force_no_pi else (force_pi or is_raspberry_pi())
-        use_plain = plain_mode or (LOG_FILE is not None)
+        pi_build_flag = False if flags.force_no_pi else (flags.force_pi or is_raspberry_pi())
+        use_plain = flags.plain_mode or (LOG_FILE is not None) or ci_requested()
         print(
             "Note: docker image builds cannot be post-processed with host wasm-opt; optimize in Dockerfile for image "
             "artifacts.")
         build_docker(
             repo_root=repo_root,
             pi_build=pi_build_flag,
-            testing=testing_mode,
+            testing=flags.testing_mode,
             plain_progress=use_plain,
         )
         return
 
+    _require_tools("git", "cargo")
     backend_args = _backend_args(
-        force_pi=force_pi,
-        force_no_pi=force_no_pi,
-        testing_mode=testing_mode,
-        hitl_mode=hitl_mode,
-        test_fire_mode=test_fire_mode,
-        debug_mode=debug_mode,
+        force_pi=flags.force_pi,
+        force_no_pi=flags.force_no_pi,
+        testing_mode=flags.testing_mode,
+        hitl_mode=flags.hitl_mode,
+        test_fire_mode=flags.test_fire_mode,
+        debug_mode=flags.debug_mode,
         log_file_arg=log_file_arg,
     )
 
+    frontend_args = _frontend_build_args(flags.debug_mode, flags.max_size_mode, flags.use_existing)
+    fingerprint = _pending_frontend_build(repo_root, frontend_args)
+
     if in_docker_build():
         print("Sequential build")
-        _run_frontend_build(
-            repo_root=repo_root,
-            debug_mode=debug_mode,
-            max_size_mode=max_size_mode,
-            use_existing=use_existing,
-            log_file_arg=log_file_arg,
-        )
+        sequential_env: Optional[dict[str, str]] = None
+        if is_container():
+            sequential_env = os.environ.copy()
+            sequential_env.setdefault("CARGO_INCREMENTAL", "0")
+        if fingerprint is not None:
+            _run_frontend_build(repo_root, frontend_args, fingerprint, log_file_arg, sequential_env)
+        _run_script(repo_root, _backend_script(repo_root), backend_args, sequential_env)
+        return
+
+    if fingerprint is None:
         _run_script(repo_root, _backend_script(repo_root), backend_args)
         return
 
-    frontend_proc = mp.Process(
-        target=_run_frontend_build,
-        args=(repo_root, debug_mode, max_size_mode, use_existing, log_file_arg),
-    )
-    backend_proc = mp.Process(
-        target=_run_script,
-        args=(repo_root, _backend_script(repo_root), backend_args),
-    )
-    frontend_proc.start()
-    backend_proc.start()
-    try:
-        frontend_proc.join()
-        backend_proc.join()
-    except KeyboardInterrupt:
-        for proc in (frontend_proc, backend_proc):
-            if proc.is_alive():
-                proc.terminate()
-        for proc in (frontend_proc, backend_proc):
-            proc.join(timeout=5)
-            if proc.is_alive():
-                proc.kill()
-                proc.join()
-        raise
-    if frontend_proc.exitcode not in {0, None}:
-        sys.exit(frontend_proc.exitcode or 1)
-    if backend_proc.exitcode not in {0, None}:
-        sys.exit(backend_proc.exitcode or 1)
+    build_env = _parallel_build_env()
+    print(f"Parallel build → CARGO_BUILD_JOBS={build_env['CARGO_BUILD_JOBS']} per cargo invocation")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(_run_frontend_build, repo_root, frontend_args, fingerprint, log_file_arg, build_env),
+            executor.submit(_run_script, repo_root, _backend_script(repo_root), backend_args, build_env),
+        ]
+        try:
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        except KeyboardInterrupt:
+            _stop_parallel_builds(futures)
+            raise
+        failed = next((f for f in futures if f in done and f.exception() is not None), None)
+        if failed is not None and pending:
+            print("Parallel build → one build failed; stopping the other", file=sys.stderr)
+            _stop_parallel_builds(list(pending))
+    if failed is not None:
+        failed.result()
+    for future in futures:
+        future.result()
 
 
 if __name__ == "__main__":
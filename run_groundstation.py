@@ -7,6 +7,8 @@ import time
 import platform
 from pathlib import Path
 
+HOST_SYSTEM = platform.system()
+
 
 def warn_if_db_sidecars_present(repo_root: Path) -> None:
     db = repo_root / "data" / "groundstation.db"
@@ -62,15 +64,15 @@ def run(cmd: list[str], cwd: Path) -> None:
 
 
 def is_raspberry_pi() -> bool:
-    if platform.system() != "Linux":
+    if HOST_SYSTEM != "Linux":
         return False
     for path in (
-        Path("/sys/firmware/devicetree/base/model"),
-        Path("/proc/device-tree/model"),
+        "/sys/firmware/devicetree/base/model",
+        "/proc/device-tree/model",
     ):
         try:
-            if "raspberry pi" in path.read_text(errors="ignore").lower():
-                return True
+            with open(path, "rb") as f:
+                return b"raspberry pi" in f.read(256).lower()
         except FileNotFoundError:
             continue
     return False